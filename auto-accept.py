@@ -1,7 +1,9 @@
 import cv2
 import numpy as np
 import pyautogui
+import mss
 import time
+import math
 import logging
 import os
 import json
@@ -9,6 +11,9 @@ import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import threading
+import queue
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import keyboard
 
 
@@ -20,6 +25,30 @@ is_running = False
 stop_event = threading.Event()
 config = {}
 
+# Guards is_running; the persistent worker thread sleeps on it while auto accept is stopped
+run_condition = threading.Condition()
+worker_thread = None
+# Bumped on every start so a run still finishing its last poll cannot outlive a restart
+run_generation = 0
+
+# mss handles are not safe to share between threads, so each thread keeps its own,
+# along with the scratch buffers reused from one poll to the next
+capture_state = threading.local()
+
+# Size of the default search region and how far its center sits below the screen center.
+# The client is centered on screen and the Accept popup sits in its lower middle.
+DEFAULT_REGION_SIZE = (600, 400)
+DEFAULT_REGION_OFFSET_Y = 100
+
+def default_region():
+    """Return an (x, y, width, height) region around where the client shows the Accept button."""
+    screen_w, screen_h = pyautogui.size()
+    width = min(DEFAULT_REGION_SIZE[0], screen_w)
+    height = min(DEFAULT_REGION_SIZE[1], screen_h)
+    x = (screen_w - width) // 2
+    y = min(max((screen_h - height) // 2 + DEFAULT_REGION_OFFSET_Y, 0), screen_h - height)
+    return (x, y, width, height)
+
 def load_config(config_path=None):
     """Load configuration from JSON file."""
     base = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
@@ -31,51 +60,440 @@ def load_config(config_path=None):
         cfg = json.load(f)
     if 'threshold' not in cfg and 'threshhold' in cfg:
         cfg['threshold'] = cfg['threshhold']
+    if cfg.get('region') is None:
+        cfg['region'] = default_region()
+        logging.info(f"No region configured, searching around the screen center: {cfg['region']}")
+    elif cfg['region'] == 'full':
+        cfg['region'] = None
+
+    # Validate and load the template here so the polling loop never has to touch the file.
+    # A bad template is not fatal: the error is kept for the GUI, which lets the user pick another.
+    cfg['_template_cache'] = None
+    cfg['_template_error'] = None
+    template_path = cfg.get('template_path')
+    if template_path:
+        template_path = cfg['template_path'] = resolve_template_path(template_path, os.path.dirname(os.path.abspath(config_path)))
+        if not os.path.exists(template_path):
+            logging.error(f'Template image not found at path: {template_path}')
+            cfg['_template_error'] = f"Template image not found: {template_path}"
+        elif build_template_cache(cfg) is None:
+            cfg['_template_error'] = f"Failed to read template image: {template_path}"
     return cfg
 
-def find_accept_button(template_path, threshhold=0.8, region=None, debug=False, enable_multiscale=True):
-    """Find and click the 'Accept' button with multi-scale matching."""
+def resolve_template_path(template_path, config_dir):
+    """Resolve a relative template path next to config.json, or next to the executable when frozen."""
+    if os.path.isabs(template_path):
+        return template_path
+    candidates = [os.path.join(config_dir, template_path)]
+    if getattr(sys, 'frozen', False):
+        candidates.append(os.path.join(os.path.dirname(sys.executable), template_path))
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return candidates[-1]
+
+# Scales tried when multi-scale matching is enabled
+SCALES = [0.8, 0.9, 1.0, 1.1, 1.2]
+
+# Number of pyrDown steps used for the coarse search, and the smallest template side
+# still reliable enough to match at the coarse level
+PYRAMID_LEVELS = 2
+MIN_COARSE_TEMPLATE_SIDE = 12
+
+# Side of the thumbnail used to tell whether the screen changed since the last miss, and
+# the per-pixel difference still counted as unchanged
+CHANGE_THUMB_SIZE = 64
+CHANGE_TOLERANCE = 8
+
+# Parallelism comes from match_pool, one scale per worker, so OpenCV's own threading is
+# turned off to avoid oversubscribing the cores on these small matches
+cv2.setUseOptimized(True)
+cv2.setNumThreads(1)
+logging.info(f"OpenCV optimizations {'enabled' if cv2.useOptimized() else 'unavailable'}, {cv2.getNumThreads()} OpenCV thread(s)")
+
+# A verified match at or above this confidence ends the search without trying the other
+# scales; the scale of the last hit is tried first on the next search
+EARLY_EXIT_CONFIDENCE = 0.95
+last_winning_scale = None
+
+# matchTemplate releases the GIL, so the scales can be searched in parallel
+match_pool = ThreadPoolExecutor(max_workers=len(SCALES), thread_name_prefix='match')
+
+def detect_cuda():
+    """Return True when OpenCV was built with CUDA and a device is available."""
     try:
-        screenshot = pyautogui.screenshot(region=region)
-        screenshot = np.array(screenshot)
-        screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_RGB2GRAY)
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
 
-        if not os.path.exists(template_path):
-            logging.error(f'Template image not found at path: {template_path}')
-            return False
-    
-        template = cv2.imread(template_path, 0)
-        if template is None:
-            logging.error(f'Failed to read template image: {template_path}')
+USE_CUDA = detect_cuda()
+logging.info(f"CUDA template matching {'enabled' if USE_CUDA else 'unavailable, using CPU'}")
+
+# Persistent CUDA matcher, stream and device buffers, created on first use
+cuda_state = {}
+
+# A template pyramid level with the statistics match_ncc needs, computed once at load time:
+# the mean and the L2 norm of the zero-mean template, plus its DFT spectra keyed by DFT
+# size, filled in on first use when the template is large enough for fft_ccorr
+TemplateLevel = namedtuple('TemplateLevel', ['image', 'mean', 'norm', 'spectra'])
+
+# Templates with at least this many pixels are correlated in the frequency domain
+FFT_MIN_TEMPLATE_AREA = 50_000
+
+def make_template_level(image):
+    """Wrap a template image with its precomputed mean and zero-mean norm."""
+    mean, stddev = cv2.meanStdDev(image)
+    return TemplateLevel(image, float(mean[0, 0]), float(stddev[0, 0]) * math.sqrt(image.size), {})
+
+def build_template_pyramid(template_path, enable_multiscale=True):
+    """Load the template and return {scale: [level0, level1, ...]} of pre-scaled TemplateLevels.
+
+    Each scale also gets up to PYRAMID_LEVELS pyrDown levels for the coarse search.
+    """
+    if not os.path.exists(template_path):
+        logging.error(f'Template image not found at path: {template_path}')
+        return None
+
+    template = cv2.imread(template_path, 0)
+    if template is None:
+        logging.error(f'Failed to read template image: {template_path}')
+        return None
+
+    scales = SCALES if enable_multiscale else [1.0]
+    pyramid = {}
+    for scale in scales:
+        if scale == 1.0:
+            scaled_template = template
+        else:
+            # INTER_AREA is cheaper and cleaner when shrinking, INTER_CUBIC when enlarging
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+            scaled_template = cv2.resize(template, None, fx=scale, fy=scale, interpolation=interpolation)
+
+        levels = [scaled_template]
+        while len(levels) <= PYRAMID_LEVELS and min(levels[-1].shape) // 2 >= MIN_COARSE_TEMPLATE_SIDE:
+            levels.append(cv2.pyrDown(levels[-1]))
+        pyramid[scale] = [make_template_level(level) for level in levels]
+
+    return pyramid
+
+def build_template_cache(cfg):
+    """Precompute everything the search needs from cfg's template and store it in cfg['_template_cache'].
+
+    This runs once at startup and again whenever a new template is selected, so the polling
+    loop never touches the template file. Returns the cache, or None if the template could
+    not be loaded.
+    """
+    cfg['_template_cache'] = None
+    template_path = cfg.get('template_path')
+    if not template_path:
+        return None
+
+    pyramid = build_template_pyramid(template_path, cfg.get('enable_multiscale', True))
+    if pyramid is None:
+        return None
+
+    # The coarse levels are uploaded once when matching on the GPU
+    gpu_templates = None
+    if USE_CUDA:
+        gpu_templates = {}
+        for scale, levels in pyramid.items():
+            gpu_templates[scale] = cv2.cuda_GpuMat()
+            gpu_templates[scale].upload(levels[-1].image)
+
+    cfg['_template_cache'] = {
+        'template_path': template_path,
+        'pyramid': pyramid,
+        'gpu_templates': gpu_templates,
+    }
+    return cfg['_template_cache']
+
+def thread_buffer(name, shape, dtype=np.uint8):
+    """Return a per-thread scratch array of the given shape for the role called name.
+
+    Each role keeps one flat array that only ever grows, and the result is a view on its
+    head, so ROIs and scales of different sizes share it without reallocating once the
+    largest has been seen. The view is overwritten by this thread's next call for the
+    same role.
+    """
+    buffers = capture_state.__dict__.setdefault('buffers', {})
+    size = shape[0] * shape[1]
+    flat = buffers.get(name)
+    if flat is None or flat.size < size or flat.dtype != dtype:
+        flat = buffers[name] = np.empty(size, dtype=dtype)
+    return flat[:size].reshape(shape)
+
+def grab_screen_gray(region=None):
+    """Grab the screen (or region) with mss and return it as a grayscale frame.
+
+    The raw BGRA buffer from mss is converted in a single cvtColor pass into a buffer reused
+    across calls; no color frame is kept around once the grayscale one exists.
+    """
+    if not hasattr(capture_state, 'sct'):
+        capture_state.sct = mss.mss()
+    sct = capture_state.sct
+
+    if region:
+        left, top, width, height = region
+        monitor = {'left': int(left), 'top': int(top), 'width': int(width), 'height': int(height)}
+    else:
+        monitor = sct.monitors[1]
+
+    shot = sct.grab(monitor)
+    height, width = shot.height, shot.width
+    bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(height, width, 4)
+
+    gray = thread_buffer('gray', (height, width))
+    cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=gray)
+    return gray
+
+def screen_unchanged(screenshot_gray, search_key):
+    """Return True if the screen looks the same as at the last search that found nothing.
+
+    The comparison runs on a CHANGE_THUMB_SIZE thumbnail, which is kept in capture_state
+    so remember_miss() can store it if this poll's search misses too.
+    """
+    size = (CHANGE_THUMB_SIZE, CHANGE_THUMB_SIZE)
+    capture_state.thumb = cv2.resize(screenshot_gray, size, interpolation=cv2.INTER_AREA)
+    last_miss = getattr(capture_state, 'last_miss', None)
+    if last_miss is None or last_miss[0] != search_key:
+        return False
+    return cv2.absdiff(capture_state.thumb, last_miss[1]).max() <= CHANGE_TOLERANCE
+
+def remember_miss(search_key, missed):
+    """Record the thumbnail of a search that found nothing, or forget it after a hit."""
+    capture_state.last_miss = (search_key, capture_state.thumb) if missed else None
+
+def build_screen_pyramid(screenshot_gray, levels):
+    """Return [level0, level1, ...] of the screenshot, halving the size at each level."""
+    screen_levels = [screenshot_gray]
+    for level in range(1, levels + 1):
+        height, width = screen_levels[-1].shape
+        dst = thread_buffer(('level', level), ((height + 1) // 2, (width + 1) // 2))
+        screen_levels.append(cv2.pyrDown(screen_levels[-1], dst=dst))
+    return screen_levels
+
+def screen_integrals(image, key):
+    """Integral sum and squared sum of an image, written into reused buffers named by key."""
+    shape = (image.shape[0] + 1, image.shape[1] + 1)
+    sums = thread_buffer(('sum', key), shape, np.float64)
+    sqsums = thread_buffer(('sqsum', key), shape, np.float64)
+    return cv2.integral2(image, sums, sqsums, cv2.CV_64F, cv2.CV_64F)
+
+def fft_ccorr(image, template, result):
+    """TM_CCORR of image and template computed with DFTs, written into result.
+
+    The template spectrum depends only on the DFT size, so it is computed once and kept
+    on the TemplateLevel; each call only transforms the image.
+    """
+    h, w = template.image.shape
+    rows, cols = result.shape
+    dft_size = (cv2.getOptimalDFTSize(image.shape[0]), cv2.getOptimalDFTSize(image.shape[1]))
+
+    template_spectrum = template.spectra.get(dft_size)
+    if template_spectrum is None:
+        padded = np.zeros(dft_size, dtype=np.float32)
+        padded[:h, :w] = template.image
+        template_spectrum = template.spectra[dft_size] = cv2.dft(padded)
+
+    padded = thread_buffer('fft_image', dft_size, np.float32)
+    padded.fill(0)
+    padded[:image.shape[0], :image.shape[1]] = image
+    spectrum = cv2.dft(padded, dst=thread_buffer('fft_spectrum', dft_size, np.float32))
+    spectrum = cv2.mulSpectrums(spectrum, template_spectrum, 0, c=spectrum, conjB=True)
+    correlation = cv2.idft(spectrum, dst=padded, flags=cv2.DFT_SCALE | cv2.DFT_REAL_OUTPUT)
+    # The DFT is at least as large as the image, so the valid positions never wrap around
+    result[:] = correlation[:rows, :cols]
+    return result
+
+def match_ncc(image, template, sums=None):
+    """Equivalent of matchTemplate(TM_CCOEFF_NORMED) built from a plain TM_CCORR.
+
+    The template side of the normalization comes from the TemplateLevel. The image side
+    comes from the integral images in sums, which callers matching several templates
+    against the same image compute once and share.
+
+    All intermediates live in per-thread buffers, so the returned array is only valid
+    until this thread's next call to match_ncc.
+    """
+    if sums is None:
+        sums = screen_integrals(image, 'window')
+    h, w = template.image.shape
+    shape = (image.shape[0] - h + 1, image.shape[1] - w + 1)
+    rows, cols = shape
+    res = thread_buffer('ccorr', shape, np.float32)
+    if template.image.size >= FFT_MIN_TEMPLATE_AREA:
+        fft_ccorr(image, template, res)
+    else:
+        cv2.matchTemplate(image, template.image, cv2.TM_CCORR, result=res)
+
+    def window_sums(table, out):
+        np.subtract(table[h:h + rows, w:w + cols], table[:rows, w:w + cols], out=out)
+        out -= table[h:h + rows, :cols]
+        out += table[:rows, :cols]
+        return out
+
+    window_sum = window_sums(sums[0], thread_buffer('window_sum', shape, np.float64))
+    window_sqsum = window_sums(sums[1], thread_buffer('window_sqsum', shape, np.float64))
+    scratch = thread_buffer('scratch', shape, np.float64)
+
+    # denominator = norm_T * sqrt(sum(I^2) - sum(I)^2 / n), built in place in window_sqsum
+    np.multiply(window_sum, window_sum, out=scratch)
+    scratch /= template.image.size
+    window_sqsum -= scratch
+    np.maximum(window_sqsum, 0, out=window_sqsum)
+    np.sqrt(window_sqsum, out=window_sqsum)
+    window_sqsum *= template.norm
+    denominator = window_sqsum
+
+    # sum((I - mean_I) * (T - mean_T)) == sum(I * T) - mean_T * sum(I)
+    np.multiply(window_sum, template.mean, out=scratch)
+    np.subtract(res, scratch, out=scratch)
+
+    ncc = thread_buffer('ncc', shape, np.float32)
+    ncc.fill(0)
+    np.divide(scratch, denominator, out=ncc, where=denominator > 1e-3, casting='same_kind')
+    return ncc
+
+def coarse_search(screen_levels, template_levels, screen_sums=None):
+    """Match the smallest template level and return (confidence, level0_location, level), or None."""
+    level = len(template_levels) - 1
+    image = screen_levels[level]
+    template = template_levels[level]
+    if template.image.shape[1] > image.shape[1] or template.image.shape[0] > image.shape[0]:
+        return None
+
+    sums = screen_sums.get(level) if screen_sums else None
+    res = match_ncc(image, template, sums)
+    _, max_val, _, max_loc = cv2.minMaxLoc(res)
+    return max_val, (max_loc[0] << level, max_loc[1] << level), level
+
+def cuda_coarse_search(screen_levels, pyramid, gpu_templates):
+    """GPU version of coarse_search for all scales, returning {scale: coarse_search result}."""
+    if not cuda_state:
+        cuda_state['matcher'] = cv2.cuda.createTemplateMatching(cv2.CV_8UC1, cv2.TM_CCOEFF_NORMED)
+        cuda_state['stream'] = cv2.cuda_Stream()
+        cuda_state['screens'] = {}
+        cuda_state['results'] = {}
+    matcher = cuda_state['matcher']
+    stream = cuda_state['stream']
+
+    uploaded = set()
+    pending = []
+    coarse_results = {}
+    for scale, template_levels in pyramid.items():
+        level = len(template_levels) - 1
+        image = screen_levels[level]
+        template = template_levels[level].image
+        if template.shape[1] > image.shape[1] or template.shape[0] > image.shape[0]:
+            coarse_results[scale] = None
+            continue
+
+        gpu_image = cuda_state['screens'].setdefault(level, cv2.cuda_GpuMat())
+        if level not in uploaded:
+            gpu_image.upload(image, stream)
+            uploaded.add(level)
+        gpu_result = cuda_state['results'].setdefault(scale, cv2.cuda_GpuMat())
+        gpu_result = matcher.match(gpu_image, gpu_templates[scale], gpu_result, stream)
+        pending.append((scale, level, gpu_result))
+
+    stream.waitForCompletion()
+    for scale, level, gpu_result in pending:
+        _, max_val, _, max_loc = cv2.cuda.minMaxLoc(gpu_result)
+        coarse_results[scale] = (max_val, (max_loc[0] << level, max_loc[1] << level), level)
+    return coarse_results
+
+def refine_match(screenshot_gray, template, coarse_loc, level):
+    """Re-run the match at full resolution in a small window around a coarse hit."""
+    h, w = template.image.shape
+    pad = 2 << level
+    x0 = max(coarse_loc[0] - pad, 0)
+    y0 = max(coarse_loc[1] - pad, 0)
+    x1 = min(coarse_loc[0] + w + pad, screenshot_gray.shape[1])
+    y1 = min(coarse_loc[1] + h + pad, screenshot_gray.shape[0])
+    if x1 - x0 < w or y1 - y0 < h:
+        return -1.0, None
+
+    res = match_ncc(screenshot_gray[y0:y1, x0:x1], template)
+    _, max_val, _, max_loc = cv2.minMaxLoc(res)
+    return max_val, (max_loc[0] + x0, max_loc[1] + y0)
+
+def find_accept_button(template_cache, threshhold=0.8, region=None, debug=False):
+    """Find and click the 'Accept' button with coarse-to-fine multi-scale matching.
+
+    template_cache is the dict prepared by build_template_cache.
+    """
+    global last_winning_scale
+    try:
+        pyramid = template_cache['pyramid']
+
+        screenshot_gray = grab_screen_gray(region)
+
+        # Nothing on screen changed since the last search came up empty, so it would miss again
+        search_key = (template_cache['template_path'], list(pyramid), threshhold, region)
+        if screen_unchanged(screenshot_gray, search_key):
+            logging.debug("Screen unchanged since last miss, skipping search.")
             return False
-        
+
+        levels = max(len(template_levels) for template_levels in pyramid.values()) - 1
+        screen_levels = build_screen_pyramid(screenshot_gray, levels)
+
+        # The image-side integrals are shared by every scale searched on the same level
+        gpu_templates = template_cache['gpu_templates']
+        screen_sums = {}
+        for template_levels in pyramid.values():
+            level = len(template_levels) - 1
+            if level not in screen_sums:
+                screen_sums[level] = screen_integrals(screen_levels[level], level)
+
+        # Try the scale that matched last time on its own first; a confident hit ends the search
+        coarse_results = {}
+        refined = {}
+        first_scale = last_winning_scale if last_winning_scale in pyramid else None
+        if first_scale is not None:
+            coarse = coarse_search(screen_levels, pyramid[first_scale], screen_sums)
+            coarse_results[first_scale] = coarse
+            if coarse is not None:
+                refined[first_scale] = refine_match(screenshot_gray, pyramid[first_scale][0], coarse[1], coarse[2])
+
+        if first_scale not in refined or refined[first_scale][0] < EARLY_EXIT_CONFIDENCE:
+            # Localize the other scales on the downsampled screenshot, on the GPU when available
+            # and otherwise one scale per worker
+            remaining = {scale: levels for scale, levels in pyramid.items() if scale != first_scale}
+            if gpu_templates is not None:
+                coarse_results.update(cuda_coarse_search(screen_levels, remaining, gpu_templates))
+            else:
+                scales = list(remaining)
+                results = match_pool.map(
+                    lambda scale: coarse_search(screen_levels, remaining[scale], screen_sums), scales)
+                coarse_results.update(zip(scales, results))
+
+        candidates = []
+        for scale, coarse in coarse_results.items():
+            if coarse is not None:
+                coarse_val, coarse_loc, level = coarse
+                candidates.append((coarse_val, scale, coarse_loc, level))
+
         best_match = None
         best_val = threshhold
         best_scale = 1.0
-        
-        scales = [1.0]
-        if enable_multiscale:
-            scales = [0.8, 0.9, 1.0, 1.1, 1.2]
-        
-        for scale in scales:
-            if scale != 1.0:
-                scaled_template = cv2.resize(template, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+
+        # Verify the most promising candidates at full resolution, stopping at the first hit
+        for coarse_val, scale, coarse_loc, level in sorted(candidates, reverse=True):
+            template = pyramid[scale][0]
+            if scale in refined:
+                max_val, max_loc = refined[scale]
             else:
-                scaled_template = template
-            
-            w, h = scaled_template.shape[::-1]
-            
-            if w > screenshot_gray.shape[1] or h > screenshot_gray.shape[0]:
-                continue
-            
-            res = cv2.matchTemplate(screenshot_gray, scaled_template, cv2.TM_CCOEFF_NORMED)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
-            
+                max_val, max_loc = refine_match(screenshot_gray, template, coarse_loc, level)
             if max_val > best_val:
                 best_val = max_val
                 best_match = max_loc
                 best_scale = scale
-                best_w, best_h = w, h
+                best_h, best_w = template.image.shape
+                break
+
+        remember_miss(search_key, best_match is None)
+        if best_match is not None:
+            last_winning_scale = best_scale
 
         if best_match is not None:
             offset_x, offset_y = (region[0], region[1]) if region else (0, 0)
@@ -85,8 +503,9 @@ def find_accept_button(template_path, threshhold=0.8, region=None, debug=False,
             logging.info(f"Accept button found at ({click_x},{click_y}) with scale {best_scale:.2f} and confidence {best_val:.2f}, clicked!")
             
             if debug:
-                cv2.rectangle(screenshot, best_match, (best_match[0] + best_w, best_match[1] + best_h), (0, 255, 0), 2)
-                cv2.imshow("Matched Area", screenshot)
+                debug_view = cv2.cvtColor(screenshot_gray, cv2.COLOR_GRAY2BGR)
+                cv2.rectangle(debug_view, best_match, (best_match[0] + best_w, best_match[1] + best_h), (0, 255, 0), 2)
+                cv2.imshow("Matched Area", debug_view)
                 cv2.waitKey(0)
                 cv2.destroyAllWindows()
             
@@ -99,52 +518,195 @@ def find_accept_button(template_path, threshhold=0.8, region=None, debug=False,
         logging.exception("Error during button search")
         return False
 
-def start_auto_accept():
-    """Start the auto accept loop."""
-    global is_running, config, stop_event
+# Win32 events used to wake the loop early when something new is shown on screen
+EVENT_OBJECT_SHOW = 0x8002
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_CURSOR = -9
+
+# Filled by the optional Win32 hook; stop_auto_accept puts None to wake a waiting loop.
+# One pending item is enough to wake the loop, and the hook keeps firing while auto accept
+# is stopped, so anything beyond that is dropped instead of piling up
+screen_events = queue.Queue(maxsize=1)
+screen_hook_thread = None
+
+def start_screen_event_hook():
+    """Start a Win32 SetWinEventHook on its own message-pump thread. Returns True if it is running."""
+    global screen_hook_thread
+    if screen_hook_thread is not None:
+        return True
+    if sys.platform != 'win32':
+        logging.info("Screen change events are only available on Windows, using timed polling.")
+        return False
+
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    WinEventProc = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                      wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    user32.SetWinEventHook.restype = wintypes.HANDLE
+    user32.SetWinEventHook.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+                                       wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+    started = threading.Event()
+    hooked = []
+
+    def on_event(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        # The cursor is shown and hidden constantly and never carries the Accept popup
+        if id_object != OBJID_CURSOR:
+            try:
+                screen_events.put_nowait(event)
+            except queue.Full:
+                pass
+
+    def pump():
+        callback = WinEventProc(on_event)
+        hook = user32.SetWinEventHook(EVENT_OBJECT_SHOW, EVENT_OBJECT_SHOW, None, callback, 0, 0, WINEVENT_OUTOFCONTEXT)
+        hooked.append(bool(hook))
+        started.set()
+        if not hook:
+            return
+        # Out-of-context hooks are delivered through this thread's message queue
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+    thread = threading.Thread(target=pump, daemon=True, name='screen-events')
+    thread.start()
+    started.wait()
+    if not hooked[0]:
+        logging.warning("SetWinEventHook failed, using timed polling.")
+        return False
+    screen_hook_thread = thread
+    logging.info("Screen change events enabled.")
+    return True
+
+def drain_screen_events():
+    """Discard every queued screen event, including stale stop sentinels."""
+    while True:
+        try:
+            screen_events.get_nowait()
+        except queue.Empty:
+            break
+
+def wait_for_screen_change(stop, min_wait, max_wait):
+    """Wait at least min_wait and at most max_wait seconds, ending early on a screen event.
+
+    Returns True if stopping. min_wait keeps busy desktops, which raise events constantly,
+    from turning the loop into back-to-back captures.
+    """
+    if stop.wait(min_wait):
+        return True
+    if screen_hook_thread is None:
+        return stop.wait(max(max_wait - min_wait, 0))
+    try:
+        screen_events.get(timeout=max(max_wait - min_wait, 0))
+    except queue.Empty:
+        pass
+    # One change on screen usually arrives as a burst of events
+    drain_screen_events()
+    return stop.is_set()
+
+def start_auto_accept(stop):
+    """Start the auto accept loop, running until the run's own stop event is set."""
+    global config
     retry_attempts = 0
-    template_path = config['template_path']
+    template_cache = config['_template_cache']
     threshhold = config.get('threshold', config.get('threshhold', 0.8))
     retry_interval = config['retry_interval']
     region = config.get('region', None)
     max_retries = config.get('max_retries', 10)
     debug = config.get('debug', False)
-    enable_multiscale = config.get('enable_multiscale', True)
+    max_idle = config.get('max_idle', 10)
+    use_screen_events = config.get('screen_events', False) and start_screen_event_hook()
+    drain_screen_events()
 
-    while is_running and not stop_event.is_set():
-        if find_accept_button(template_path, threshhold, region, debug, enable_multiscale):
+    while not stop.is_set():
+        if find_accept_button(template_cache, threshhold, region, debug):
             retry_attempts = 0
             print("Accept button found and clicked!")
-            if stop_event.wait(retry_interval):
+            if stop.wait(retry_interval):
                 break
         else:
             print("Accept button not found. Retrying...")
             retry_attempts += 1
-            if retry_attempts > max_retries:
+            # Report once per miss streak; idling on screen events can miss for hours
+            if retry_attempts == max_retries + 1:
                 logging.error("Max retries reached. Please check the application.")
 
-            if stop_event.wait(min(10, retry_interval * retry_attempts)):
+            # With screen events the loop sleeps until something is shown, polling at most
+            # every retry_interval and at least every max_idle seconds
+            if use_screen_events:
+                if wait_for_screen_change(stop, retry_interval, max(max_idle, retry_interval)):
+                    break
+            elif stop.wait(min(10, retry_interval * retry_attempts)):
                 break
 
+def auto_accept_worker():
+    """Run the auto accept loop each time it is started, sleeping on run_condition in between.
+
+    The thread lives for the whole session, so its capture handle and buffers are reused
+    across start/stop cycles instead of being rebuilt by a new thread every time.
+    """
+    global is_running
+    last_generation = run_generation
+    while True:
+        with run_condition:
+            while not is_running or run_generation == last_generation:
+                run_condition.wait()
+            last_generation = run_generation
+            stop = stop_event
+        try:
+            start_auto_accept(stop)
+        except Exception:
+            logging.exception("Auto accept loop failed")
+            with run_condition:
+                # A restart may already have begun a newer run; leave that one alone
+                if run_generation == last_generation:
+                    is_running = False
+
+def start_worker():
+    """Start the persistent auto accept worker thread if it is not running yet."""
+    global worker_thread
+    if worker_thread is None:
+        worker_thread = threading.Thread(target=auto_accept_worker, daemon=True, name='auto-accept')
+        worker_thread.start()
+
 def stop_auto_accept():
     """Stop the auto accept loop."""
     global is_running, stop_event
-    is_running = False
-    stop_event.set()
+    with run_condition:
+        is_running = False
+        stop_event.set()
+    if screen_hook_thread is not None:
+        # Wake a loop waiting on screen events, unless an event is already pending to do it;
+        # start_auto_accept drains any leftover
+        try:
+            screen_events.put_nowait(None)
+        except queue.Full:
+            pass
     print("Auto Accept Stopped")
 
 def start_thread():
-    """Start the auto accept process in a new thread."""
-    global is_running, stop_event
+    """Wake the worker thread to start the auto accept process."""
+    global is_running, stop_event, run_generation
     if is_running:
         messagebox.showinfo("Info", "Already running.")
         return
     if not config['template_path']:
         messagebox.showerror("Error", "Please select a template image first.")
         return
-    stop_event.clear()
-    is_running = True
-    threading.Thread(target=start_auto_accept, daemon=True).start()
+    if not config.get('_template_cache'):
+        messagebox.showerror("Error", "The selected template image could not be loaded.")
+        return
+    start_worker()
+    with run_condition:
+        # A fresh event keeps the previous run's event set, so a run still mid-poll
+        # exits instead of carrying on with the old settings
+        stop_event = threading.Event()
+        run_generation += 1
+        is_running = True
+        run_condition.notify()
 
 def start_auto_accept_hotkey():
     """Function to start auto-accept using hotkey."""
@@ -184,6 +746,8 @@ def create_gui():
     def select_template():
         config['template_path'] = filedialog.askopenfilename(title="Select Template", filetypes=[("PNG files", "*.png")])
         template_label.config(text=f"Template: {os.path.basename(config['template_path'])}")
+        if config['template_path'] and build_template_cache(config) is None:
+            messagebox.showerror("Error", "Failed to load the selected template image.")
 
     def start_button_pressed():
         try:
@@ -226,12 +790,16 @@ def create_gui():
     stop_button = tk.Button(root, text="Stop Auto Accept", command=stop_auto_accept)
     stop_button.pack(pady=10)
 
+    if config.get('_template_error'):
+        root.after(0, lambda: messagebox.showerror("Error", f"{config['_template_error']}\nPlease select a template image."))
+
     root.mainloop()
 
 def main():
     """Main function to start the GUI and load the configuration."""
     global config
     config = load_config()
+    start_worker()
     create_gui()
 
 if __name__ == '__main__':
@@ -0,0 +1,89 @@
+import importlib.util
+import os
+
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'auto-accept.py')
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Import auto-accept.py; skipped where its GUI/input dependencies cannot load."""
+    spec = importlib.util.spec_from_file_location('auto_accept', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        pytest.skip(f'auto-accept.py cannot be imported here: {e}')
+    return module
+
+
+def make_template():
+    template = np.full((60, 200), 40, dtype=np.uint8)
+    cv2.rectangle(template, (5, 5), (195, 55), 200, 3)
+    cv2.putText(template, 'ACCEPT', (30, 45), cv2.FONT_HERSHEY_SIMPLEX, 1.2, 230, 3)
+    return template
+
+
+def make_screen(template, gain, offset, panel, shift):
+    """A 600x400 region with a flat panel and the template, re-lit and shifted by a sub-pixel amount."""
+    rng = np.random.default_rng(0)
+    screen = cv2.GaussianBlur((30 + rng.integers(0, 25, (400, 600))).astype(np.uint8), (5, 5), 0)
+    screen[50:350, 20:580] = panel
+    button = np.clip(template.astype(np.float32) * gain + offset, 0, 255)
+    matrix = np.float32([[1, 0, shift[0]], [0, 1, shift[1]]])
+    button = cv2.warpAffine(button, matrix, (200, 60), borderMode=cv2.BORDER_REPLICATE)
+    screen[170:230, 200:400] = button.astype(np.uint8)
+    return screen
+
+
+def search(app, screen, pyramid, threshold=0.8):
+    levels = max(len(template_levels) for template_levels in pyramid.values()) - 1
+    screen_levels = app.build_screen_pyramid(screen, levels)
+    best = None
+    for scale, template_levels in pyramid.items():
+        coarse = app.coarse_search(screen_levels, template_levels)
+        if coarse is None:
+            continue
+        val, loc = app.refine_match(screen, template_levels[0], coarse[1], coarse[2])
+        if val > threshold and (best is None or val > best[0]):
+            best = (val, loc)
+    return best
+
+
+@pytest.mark.parametrize('gain, offset, panel', [(0.5, 90, 40), (0.7, -20, 60), (1.0, 70, 0), (1.0, 0, 0)])
+def test_finds_relit_button(app, tmp_path, gain, offset, panel):
+    path = str(tmp_path / 'template.png')
+    cv2.imwrite(path, make_template())
+    pyramid = app.build_template_pyramid(path)
+
+    for shift in [(0.0, 0.0), (0.5, 0.25), (0.8, 0.75)]:
+        screen = make_screen(make_template(), gain, offset, panel, shift)
+        best = search(app, screen, pyramid)
+        assert best is not None, shift
+        assert abs(best[1][0] - 200) <= 2 and abs(best[1][1] - 170) <= 2, best
+
+
+
+@pytest.mark.parametrize('pad', [None, 4])
+def test_fft_ncc_matches_opencv(app, monkeypatch, pad):
+    """Templates over FFT_MIN_TEMPLATE_AREA go through fft_ccorr, on a full frame and on a refine window."""
+    template = cv2.resize(make_template(), (450, 135))
+    assert template.size >= app.FFT_MIN_TEMPLATE_AREA
+    screen = make_screen(make_template(), 1.0, 0, 60, (0.0, 0.0))
+    screen[200:335, 100:550] = template
+    if pad is not None:
+        screen = screen[200 - pad:335 + pad, 100 - pad:550 + pad]
+
+    calls = []
+    fft_ccorr = app.fft_ccorr
+    monkeypatch.setattr(app, 'fft_ccorr', lambda *args: calls.append(args) or fft_ccorr(*args))
+    res = app.match_ncc(screen, app.make_template_level(template))
+    assert calls
+
+    expected = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+    assert res.shape == expected.shape
+    np.testing.assert_allclose(res, expected, atol=1e-4)